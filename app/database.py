@@ -1,31 +1,85 @@
-from sqlmodel import SQLModel, create_engine, Session, select
-from typing import Generator
+from sqlalchemy import event, insert, update
+from sqlalchemy.engine import Connection, make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import Any, AsyncGenerator, Dict
+import asyncio
 import os
 
 # Database configuration
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./app.db")
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./app.db")
+SQL_ECHO = os.getenv("SQL_ECHO", "0") == "1"  # Log every SQL statement
+
+# The engine is async: plain SQLite URLs are switched to the aiosqlite driver,
+# other backends must name an async driver (e.g. postgresql+asyncpg)
+database_url = make_url(DATABASE_URL)
+is_sqlite = database_url.get_backend_name() == "sqlite"
+if is_sqlite and database_url.get_driver_name() == "pysqlite":
+    database_url = database_url.set(drivername="sqlite+aiosqlite")
+
+# Connection pooling: an in-memory SQLite database lives on a single
+# connection, so share it; otherwise keep warm connections between requests
+pool_options: Dict[str, Any]
+if is_sqlite and database_url.database in (None, "", ":memory:"):
+    pool_options = {"poolclass": StaticPool}
+else:
+    pool_options = {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_recycle": 3600,
+    }
 
 # Create engine
-engine = create_engine(
-    DATABASE_URL,
-    echo=True,  # Set to False in production
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
+engine = create_async_engine(
+    database_url,
+    echo=SQL_ECHO,
+    echo_pool=False,
+    connect_args={"check_same_thread": False} if is_sqlite else {},
+    **pool_options,
 )
 
 
-def create_db_and_tables():
+def set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """Use WAL journaling and relaxed syncing on every new SQLite connection"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB
+    cursor.close()
+
+
+if is_sqlite:
+    event.listen(engine.sync_engine, "connect", set_sqlite_pragmas)
+
+
+def create_all_with_indexes(connection: Connection) -> None:
+    """Create missing tables, then any indexes missing from existing tables"""
+    SQLModel.metadata.create_all(connection)
+    # create_all skips tables that already exist, along with their indexes
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+
+async def create_db_and_tables():
     """Create database and tables"""
-    SQLModel.metadata.create_all(engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(create_all_with_indexes)
 
 
-def get_session() -> Generator[Session, None, None]:
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """Dependency to get database session"""
-    with Session(engine) as session:
+    async with AsyncSession(engine) as session:
         yield session
 
 
 # Initialize database on import
-def init_db():
+async def init_db():
     """Initialize database with sample data"""
     from app.models.task_model import (
         User,
@@ -33,16 +87,17 @@ def init_db():
         Task,
         Tag,
         Comment,
+        TaskTagLink,
         TaskStatus,
         TaskPriority,
     )
 
-    create_db_and_tables()
+    await create_db_and_tables()
 
     # Create sample data
-    with Session(engine) as session:
+    async with AsyncSession(engine) as session:
         # Check if we already have data
-        existing_users = session.exec(select(User)).first()
+        existing_users = (await session.exec(select(User))).first()
         if existing_users:
             return
 
@@ -53,11 +108,8 @@ def init_db():
         user2 = User(
             username="jane_smith", email="jane@example.com", full_name="Jane Smith"
         )
-        session.add(user1)
-        session.add(user2)
-        session.commit()
-        session.refresh(user1)
-        session.refresh(user2)
+        session.add_all([user1, user2])
+        await session.flush()
 
         # Create projects
         project1 = Project(
@@ -70,86 +122,115 @@ def init_db():
             description="Creating a mobile application",
             owner_id=user2.id,
         )
-        session.add(project1)
-        session.add(project2)
-        session.commit()
-        session.refresh(project1)
-        session.refresh(project2)
-
-        # Create tags
-        tag1 = Tag(name="Frontend", color="#3498db")
-        tag2 = Tag(name="Backend", color="#e74c3c")
-        tag3 = Tag(name="Database", color="#2ecc71")
-        tag4 = Tag(name="Bug Fix", color="#f39c12")
-        session.add_all([tag1, tag2, tag3, tag4])
-        session.commit()
-
-        # Create tasks
-        task1 = Task(
-            title="Create user authentication",
-            description="Implement JWT authentication for the application",
-            status=TaskStatus.IN_PROGRESS,
-            priority=TaskPriority.HIGH,
-            project_id=project1.id,
-            assignee_id=user1.id,
-            estimated_hours=8.0,
-        )
-
-        task2 = Task(
-            title="Design database schema",
-            description="Create the database schema for the application",
-            status=TaskStatus.COMPLETED,
-            priority=TaskPriority.MEDIUM,
-            project_id=project1.id,
-            assignee_id=user2.id,
-            estimated_hours=4.0,
-            actual_hours=3.5,
-            is_completed=True,
+        session.add_all([project1, project2])
+        await session.flush()
+
+        # Create tags in one multi-row INSERT. SQLite does not guarantee the
+        # order of RETURNING rows, so map the generated ids back by name
+        tag_insert = insert(Tag).returning(Tag.name, Tag.id)
+        tag_rows = [
+            {"name": "Frontend", "color": "#3498db"},
+            {"name": "Backend", "color": "#e74c3c"},
+            {"name": "Database", "color": "#2ecc71"},
+            {"name": "Bug Fix", "color": "#f39c12"},
+        ]
+        tag_ids = dict((await session.exec(tag_insert, params=tag_rows)).tuples().all())
+
+        # Create tasks. Rows are batched by the keys they supply, so every row
+        # lists the same columns and render_nulls keeps the None values
+        task_insert = (
+            insert(Task)
+            .returning(Task.title, Task.id)
+            .execution_options(render_nulls=True)
         )
-
-        task3 = Task(
-            title="Build React components",
-            description="Create reusable React components for the UI",
-            status=TaskStatus.PENDING,
-            priority=TaskPriority.MEDIUM,
-            project_id=project1.id,
-            assignee_id=user1.id,
-            parent_task_id=None,  # This will be set after task1 is saved
-            estimated_hours=12.0,
+        task_rows = [
+            {
+                "title": "Create user authentication",
+                "description": "Implement JWT authentication for the application",
+                "status": TaskStatus.IN_PROGRESS,
+                "priority": TaskPriority.HIGH,
+                "project_id": project1.id,
+                "assignee_id": user1.id,
+                "estimated_hours": 8.0,
+                "actual_hours": None,
+                "is_completed": False,
+            },
+            {
+                "title": "Design database schema",
+                "description": "Create the database schema for the application",
+                "status": TaskStatus.COMPLETED,
+                "priority": TaskPriority.MEDIUM,
+                "project_id": project1.id,
+                "assignee_id": user2.id,
+                "estimated_hours": 4.0,
+                "actual_hours": 3.5,
+                "is_completed": True,
+            },
+            {
+                "title": "Build React components",
+                "description": "Create reusable React components for the UI",
+                "status": TaskStatus.PENDING,
+                "priority": TaskPriority.MEDIUM,
+                "project_id": project1.id,
+                "assignee_id": user1.id,
+                "estimated_hours": 12.0,
+                "actual_hours": None,
+                "is_completed": False,
+            },
+        ]
+        task_ids = dict(
+            (await session.exec(task_insert, params=task_rows)).tuples().all()
         )
-
-        session.add_all([task1, task2, task3])
-        session.commit()
-        session.refresh(task1)
-        session.refresh(task2)
-        session.refresh(task3)
+        task1_id = task_ids["Create user authentication"]
+        task2_id = task_ids["Design database schema"]
+        task3_id = task_ids["Build React components"]
 
         # Set parent task relationship
-        task3.parent_task_id = task1.id
-        session.add(task3)
-        session.commit()
+        await session.exec(
+            update(Task).where(Task.id == task3_id).values(parent_task_id=task1_id)
+        )
 
         # Add tags to tasks (many-to-many)
-        task1.tags.extend([tag2, tag3])  # Backend, Database
-        task2.tags.append(tag3)  # Database
-        task3.tags.append(tag1)  # Frontend
-        session.add_all([task1, task2, task3])
-        session.commit()
+        await session.exec(
+            insert(TaskTagLink),
+            params=[
+                {"task_id": task1_id, "tag_id": tag_ids["Backend"]},
+                {"task_id": task1_id, "tag_id": tag_ids["Database"]},
+                {"task_id": task2_id, "tag_id": tag_ids["Database"]},
+                {"task_id": task3_id, "tag_id": tag_ids["Frontend"]},
+            ],
+        )
 
         # Create comments
-        comment1 = Comment(
-            content="Great progress on this task!", task_id=task1.id, author_id=user2.id
+        await session.exec(
+            insert(Comment),
+            params=[
+                {
+                    "content": "Great progress on this task!",
+                    "task_id": task1_id,
+                    "author_id": user2.id,
+                },
+                {
+                    "content": "Schema looks good, ready for implementation",
+                    "task_id": task2_id,
+                    "author_id": user1.id,
+                },
+            ],
         )
-        comment2 = Comment(
-            content="Schema looks good, ready for implementation",
-            task_id=task2.id,
-            author_id=user1.id,
-        )
-        session.add_all([comment1, comment2])
-        session.commit()
+
+        # Commit all sample data in a single transaction
+        await session.commit()
 
         print("✅ Database initialized with sample data!")
 
 
+async def main():
+    """Initialize the database and release pooled connections"""
+    try:
+        await init_db()
+    finally:
+        await engine.dispose()
+
+
 if __name__ == "__main__":
-    init_db()
+    asyncio.run(main())
@@ -12,6 +12,12 @@ class ResponseModel(BaseModel, Generic[T]):
     data: T | None = None
 
 
+class PaginatedResponseModel(ResponseModel[T], Generic[T]):
+    """Successful list response with a cursor for the next page"""
+
+    next_after_id: int | None = None
+
+
 class ErrorResponseModel(BaseModel):
     """Standard error response"""
 
@@ -1,5 +1,7 @@
+from pydantic import StringConstraints
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field, Relationship
-from typing import Optional, List
+from typing import Annotated, Optional, List
 from datetime import datetime, timezone
 from enum import Enum
 
@@ -9,6 +11,11 @@ def utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+# Constrained string types (patterns are compiled once by pydantic-core)
+EmailAddress = Annotated[str, StringConstraints(pattern=r"^[^@]+@[^@]+\.[^@]+$")]
+HexColor = Annotated[str, StringConstraints(pattern=r"^#[0-9A-Fa-f]{6}$")]
+
+
 # Enums for better type safety
 class TaskStatus(str, Enum):
     PENDING = "pending"
@@ -35,7 +42,7 @@ class TaskTagLink(SQLModel, table=True):
 # Base Models (shared fields)
 class UserBase(SQLModel):
     username: str = Field(min_length=3, max_length=50)
-    email: str = Field(regex=r"^[^@]+@[^@]+\.[^@]+$")
+    email: EmailAddress
     full_name: Optional[str] = Field(default=None, max_length=100)
     is_active: bool = Field(default=True)
 
@@ -59,7 +66,7 @@ class TaskBase(SQLModel):
 
 class TagBase(SQLModel):
     name: str = Field(min_length=1, max_length=50)
-    color: Optional[str] = Field(default="#3498db", regex=r"^#[0-9A-Fa-f]{6}$")
+    color: Optional[HexColor] = Field(default="#3498db")
 
 
 class CommentBase(SQLModel):
@@ -106,6 +113,14 @@ class Tag(TagBase, table=True):
 
 
 class Task(TaskBase, table=True):
+    # Indexes backing the list filters and the subtask lookup
+    __table_args__ = (
+        Index("ix_task_project_status", "project_id", "status"),
+        Index("ix_task_assignee_status", "assignee_id", "status"),
+        Index("ix_task_parent", "parent_task_id"),
+        Index("ix_task_is_completed", "is_completed"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     created_at: datetime = Field(default_factory=utc_now)
     updated_at: datetime = Field(default_factory=utc_now)
@@ -140,7 +155,7 @@ class Comment(CommentBase, table=True):
     updated_at: datetime = Field(default_factory=utc_now)
 
     # Foreign Keys
-    task_id: Optional[int] = Field(default=None, foreign_key="task.id")
+    task_id: Optional[int] = Field(default=None, foreign_key="task.id", index=True)
     author_id: Optional[int] = Field(default=None, foreign_key="user.id")
 
     # Many-to-One: Comment belongs to one Task
@@ -157,7 +172,7 @@ class UserCreate(UserBase):
 
 class UserUpdate(SQLModel):
     username: Optional[str] = Field(default=None, min_length=3, max_length=50)
-    email: Optional[str] = Field(default=None, regex=r"^[^@]+@[^@]+\.[^@]+$")
+    email: Optional[EmailAddress] = None
     full_name: Optional[str] = Field(default=None, max_length=100)
     is_active: Optional[bool] = None
 
@@ -198,7 +213,7 @@ class TagCreate(TagBase):
 
 class TagUpdate(SQLModel):
     name: Optional[str] = Field(default=None, min_length=1, max_length=50)
-    color: Optional[str] = Field(default=None, regex=r"^#[0-9A-Fa-f]{6}$")
+    color: Optional[HexColor] = None
 
 
 class CommentCreate(CommentBase):
@@ -290,6 +305,7 @@ class TaskFilter(SQLModel):
 class PaginationParams(SQLModel):
     skip: int = Field(default=0, ge=0)
     limit: int = Field(default=10, ge=1, le=100)
+    after_id: Optional[int] = Field(default=None, ge=0)  # Keyset cursor
 
 
 # Bulk Operations
@@ -300,3 +316,11 @@ class TaskBulkUpdate(SQLModel):
     assignee_id: Optional[int] = None
     add_tag_ids: Optional[List[int]] = None
     remove_tag_ids: Optional[List[int]] = None
+
+
+# Resolve the forward references above once at import time
+UserReadWithRelations.model_rebuild()
+ProjectReadWithRelations.model_rebuild()
+TagReadWithTasks.model_rebuild()
+CommentReadWithRelations.model_rebuild()
+TaskReadWithRelations.model_rebuild()
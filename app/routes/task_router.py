@@ -1,6 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
-from typing import List, Optional, Dict, Any
+from pydantic import TypeAdapter
+from sqlalchemy import delete, func, insert, literal, union_all, update
+from sqlalchemy.orm import selectinload
+from sqlmodel import or_, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import List, Mapping, Optional, Dict, Any
 from app.models.task_model import (
     Task,
     TaskCreate,
@@ -10,28 +14,49 @@ from app.models.task_model import (
     User,
     Project,
     Tag,
+    TaskTagLink,
     Comment,
+    CommentRead,
     TaskStatus,
     TaskPriority,
     PaginationParams,
 )
-from app.models.response_model import ResponseModel
+from app.models.response_model import PaginatedResponseModel, ResponseModel
 from app.database import get_session
 
 router: APIRouter = APIRouter()
 
+# Built once so get_task reuses the compiled validator on every request
+task_with_relations_adapter: TypeAdapter[TaskReadWithRelations] = TypeAdapter(
+    TaskReadWithRelations
+)
+
+# Task columns backing each TaskRead field, for list queries
+task_read_columns = [getattr(Task, field) for field in TaskRead.model_fields]
+
+
+async def link_task_tags(
+    session: AsyncSession, task_id: int, tag_ids: List[int]
+) -> None:
+    """Link existing tags to a task in one INSERT ... SELECT, skipping unknown ids"""
+    tags_query = select(literal(task_id), Tag.id).where(Tag.id.in_(tag_ids))
+    await session.exec(
+        insert(TaskTagLink).from_select(["task_id", "tag_id"], tags_query)
+    )
+
 
-@router.get("/", response_model=ResponseModel[List[TaskRead]])
-def get_tasks(
-    session: Session = Depends(get_session),
+@router.get("/", response_model=PaginatedResponseModel[List[TaskRead]])
+async def get_tasks(
+    session: AsyncSession = Depends(get_session),
     pagination: PaginationParams = Depends(),
     status: Optional[TaskStatus] = None,
     priority: Optional[TaskPriority] = None,
     project_id: Optional[int] = None,
     assignee_id: Optional[int] = None,
-) -> ResponseModel[List[TaskRead]]:
+) -> PaginatedResponseModel[List[Mapping[str, Any]]]:
     """Get all tasks with optional filtering"""
-    query = select(Task)
+    # Select plain columns: rows skip ORM hydration and the identity map
+    query = select(*task_read_columns)
 
     # Apply filters
     if status:
@@ -43,160 +68,197 @@ def get_tasks(
     if assignee_id:
         query = query.where(Task.assignee_id == assignee_id)
 
-    # Apply pagination
-    query = query.offset(pagination.skip).limit(pagination.limit)
+    # Apply pagination: seek past after_id when given, otherwise fall back to skip
+    query = query.order_by(Task.id)
+    if pagination.after_id is not None:
+        query = query.where(Task.id > pagination.after_id)
+    else:
+        query = query.offset(pagination.skip)
+    query = query.limit(pagination.limit)
 
-    tasks = session.exec(query).all()
-    task_reads = [TaskRead.model_validate(task) for task in tasks]
-    return ResponseModel(data=task_reads)
+    rows: List[Mapping[str, Any]] = [
+        row._mapping for row in (await session.exec(query)).all()
+    ]
+
+    # FastAPI validates the rows once against response_model
+    next_after_id = rows[-1]["id"] if len(rows) == pagination.limit else None
+    return PaginatedResponseModel(data=rows, next_after_id=next_after_id)
 
 
 @router.get("/{task_id}", response_model=TaskReadWithRelations)
-def get_task(
-    task_id: int, session: Session = Depends(get_session)
+async def get_task(
+    task_id: int, session: AsyncSession = Depends(get_session)
 ) -> TaskReadWithRelations:
     """Get a single task with all relationships"""
-    task = session.get(Task, task_id)
+    query = (
+        select(Task)
+        .where(Task.id == task_id)
+        .options(
+            selectinload(Task.project),
+            selectinload(Task.assignee),
+            selectinload(Task.parent_task),
+            selectinload(Task.subtasks),
+            selectinload(Task.tags),
+            selectinload(Task.comments),
+        )
+    )
+    task = (await session.exec(query)).first()
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
-    return TaskReadWithRelations.model_validate(task)
+    return task_with_relations_adapter.validate_python(task, from_attributes=True)
 
 
 @router.post("/", response_model=TaskRead)
-def create_task(
-    task_data: TaskCreate, session: Session = Depends(get_session)
-) -> TaskRead:
+async def create_task(
+    task_data: TaskCreate, session: AsyncSession = Depends(get_session)
+) -> Task:
     """Create a new task"""
 
-    # Validate project exists if provided
+    # Validate referenced project, assignee and parent task in one round trip
+    lookups = []
     if task_data.project_id:
-        project = session.get(Project, task_data.project_id)
-        if not project:
-            raise HTTPException(status_code=404, detail="Project not found")
-
-    # Validate assignee exists if provided
+        lookups.append(
+            select(literal("project")).where(Project.id == task_data.project_id)
+        )
     if task_data.assignee_id:
-        assignee = session.get(User, task_data.assignee_id)
-        if not assignee:
-            raise HTTPException(status_code=404, detail="User not found")
-
-    # Validate parent task exists if provided
+        lookups.append(select(literal("user")).where(User.id == task_data.assignee_id))
     if task_data.parent_task_id:
-        parent_task = session.get(Task, task_data.parent_task_id)
-        if not parent_task:
+        lookups.append(
+            select(literal("task")).where(Task.id == task_data.parent_task_id)
+        )
+
+    if lookups:
+        found = set((await session.exec(union_all(*lookups))).scalars())
+        if task_data.project_id and "project" not in found:
+            raise HTTPException(status_code=404, detail="Project not found")
+        if task_data.assignee_id and "user" not in found:
+            raise HTTPException(status_code=404, detail="User not found")
+        if task_data.parent_task_id and "task" not in found:
             raise HTTPException(status_code=404, detail="Parent task not found")
 
     # Create task (excluding tag_ids from model_dump)
     task_dict = task_data.model_dump(exclude={"tag_ids"})
     task = Task(**task_dict)
     session.add(task)
-    session.commit()
-    session.refresh(task)
 
-    # Add tags if provided
+    # Link tags before committing so the task and its tags share one transaction
     if task_data.tag_ids:
-        tags: List[Tag] = []
-        for tag_id in task_data.tag_ids:
-            tag = session.get(Tag, tag_id)
-            if tag:
-                tags.append(tag)
-        task.tags.extend(tags)
-        session.add(task)
-        session.commit()
-        session.refresh(task)
+        await session.flush()
+        await link_task_tags(session, task.id, task_data.tag_ids)
 
-    return TaskRead.model_validate(task)
+    await session.commit()
+    await session.refresh(task)
+
+    return task
 
 
 @router.put("/{task_id}", response_model=TaskRead)
-def update_task(
-    task_id: int, task_data: TaskUpdate, session: Session = Depends(get_session)
+async def update_task(
+    task_id: int, task_data: TaskUpdate, session: AsyncSession = Depends(get_session)
 ) -> TaskRead:
     """Update an existing task"""
-    task = session.get(Task, task_id)
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
+    update_data = task_data.model_dump(exclude_unset=True, exclude={"tag_ids"})
 
-    # Validate assignee exists if provided
+    # Validate task and assignee in one read before writing anything
     if task_data.assignee_id:
-        assignee = session.get(User, task_data.assignee_id)
-        if not assignee:
+        lookups = union_all(
+            select(literal("task")).where(Task.id == task_id),
+            select(literal("user")).where(User.id == task_data.assignee_id),
+        )
+        found = set((await session.exec(lookups)).scalars())
+        if "task" not in found:
+            raise HTTPException(status_code=404, detail="Task not found")
+        if "user" not in found:
             raise HTTPException(status_code=404, detail="User not found")
 
-    # Update task fields
-    update_data = task_data.model_dump(exclude_unset=True, exclude={"tag_ids"})
-    for field, value in update_data.items():
-        setattr(task, field, value)
+    # Update task fields with a single UPDATE ... RETURNING when there are any
+    if update_data:
+        update_query = (
+            update(Task).where(Task.id == task_id).values(**update_data).returning(Task)
+        )
+        task = (await session.exec(update_query)).scalars().first()
+    else:
+        task = await session.get(Task, task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
 
-    # Update tags if provided
+    # Replace tag links if provided
     if task_data.tag_ids is not None:
-        tags: List[Tag] = []
-        for tag_id in task_data.tag_ids:
-            tag = session.get(Tag, tag_id)
-            if tag:
-                tags.append(tag)
-        task.tags = tags
+        await session.exec(delete(TaskTagLink).where(TaskTagLink.task_id == task_id))
+        if task_data.tag_ids:
+            await link_task_tags(session, task_id, task_data.tag_ids)
 
-    session.add(task)
-    session.commit()
-    session.refresh(task)
-    return TaskRead.model_validate(task)
+    # Snapshot the returned row before commit expires it
+    task_read = TaskRead.model_validate(task)
+    await session.commit()
+    return task_read
 
 
 @router.delete("/{task_id}", response_model=TaskRead)
-def delete_task(task_id: int, session: Session = Depends(get_session)) -> TaskRead:
+async def delete_task(
+    task_id: int, session: AsyncSession = Depends(get_session)
+) -> TaskRead:
     """Delete a task"""
-    task = session.get(Task, task_id)
+    task = await session.get(Task, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
     task_read = TaskRead.model_validate(task)
-    session.delete(task)
-    session.commit()
+    await session.delete(task)
+    await session.commit()
     return task_read
 
 
 @router.get("/{task_id}/subtasks", response_model=ResponseModel[List[TaskRead]])
-def get_subtasks(
-    task_id: int, session: Session = Depends(get_session)
-) -> ResponseModel[List[TaskRead]]:
+async def get_subtasks(
+    task_id: int, session: AsyncSession = Depends(get_session)
+) -> ResponseModel[List[Task]]:
     """Get all subtasks of a task"""
-    task = session.get(Task, task_id)
-    if not task:
+    # Fetch the parent and its subtasks together; the parent row doubles as
+    # the existence check
+    query = (
+        select(Task)
+        .where(or_(Task.id == task_id, Task.parent_task_id == task_id))
+        .order_by(Task.id)
+    )
+    tasks = (await session.exec(query)).all()
+    if not any(task.id == task_id for task in tasks):
         raise HTTPException(status_code=404, detail="Task not found")
 
-    subtasks = session.exec(select(Task).where(Task.parent_task_id == task_id)).all()
-    subtask_reads = [TaskRead.model_validate(subtask) for subtask in subtasks]
-    return ResponseModel(data=subtask_reads)
+    subtasks = [task for task in tasks if task.id != task_id]
+    return ResponseModel(data=subtasks)
 
 
-@router.get("/{task_id}/comments", response_model=ResponseModel[List[Comment]])
-def get_task_comments(
-    task_id: int, session: Session = Depends(get_session)
+@router.get("/{task_id}/comments", response_model=ResponseModel[List[CommentRead]])
+async def get_task_comments(
+    task_id: int, session: AsyncSession = Depends(get_session)
 ) -> ResponseModel[List[Comment]]:
     """Get all comments for a task"""
-    task = session.get(Task, task_id)
+    task = await session.get(Task, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
     comments = list(
-        session.exec(select(Comment).where(Comment.task_id == task_id)).all()
+        (await session.exec(select(Comment).where(Comment.task_id == task_id))).all()
     )
     return ResponseModel(data=comments)
 
 
 # Statistics endpoints
 @router.get("/stats/summary")
-def get_task_stats(session: Session = Depends(get_session)) -> Dict[str, Any]:
+async def get_task_stats(
+    session: AsyncSession = Depends(get_session),
+) -> Dict[str, Any]:
     """Get task statistics summary"""
-    total_tasks = len(session.exec(select(Task)).all())
-    completed_tasks = len(session.exec(select(Task).where(Task.is_completed)).all())
-    pending_tasks = len(
-        session.exec(select(Task).where(Task.status == TaskStatus.PENDING)).all()
-    )
-    in_progress_tasks = len(
-        session.exec(select(Task).where(Task.status == TaskStatus.IN_PROGRESS)).all()
-    )
+    stats_query = select(
+        func.count(),
+        func.count().filter(Task.is_completed),
+        func.count().filter(Task.status == TaskStatus.PENDING),
+        func.count().filter(Task.status == TaskStatus.IN_PROGRESS),
+    ).select_from(Task)
+    total_tasks, completed_tasks, pending_tasks, in_progress_tasks = (
+        await session.exec(stats_query)
+    ).one()
 
     return {
         "total_tasks": total_tasks,
@@ -1,7 +1,7 @@
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
 from app.routes import task_router
-from app.database import init_db
+from app.database import engine, init_db
 
 from typing import Dict, Any
 
@@ -9,8 +9,11 @@ from typing import Dict, Any
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize database on startup"""
-    init_db()
-    yield
+    try:
+        await init_db()
+        yield
+    finally:
+        await engine.dispose()
 
 
 app = FastAPI(